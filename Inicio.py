@@ -31,16 +31,22 @@ st.markdown(
 # DATASET
 # -------------------------------
 st.header("📊 Dataset")
-data = load_iris()
-X = data.data
-y = data.target
 
-scaler = StandardScaler()
-X = scaler.fit_transform(X)
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.25, random_state=42
-)
+@st.cache_data
+def cargar_dataset():
+    """Carga, escala y divide Iris una sola vez; los reruns reutilizan el resultado."""
+    data = load_iris()
+    X = data.data
+    y = data.target
+
+    scaler = StandardScaler()
+    X = scaler.fit_transform(X)
+
+    return train_test_split(X, y, test_size=0.25, random_state=42)
+
+
+X_train, X_test, y_train, y_test = cargar_dataset()
 
 st.write("Dataset usado: **Iris** (clasificación multiclase)")
 
@@ -63,12 +69,20 @@ max_iter = st.sidebar.slider(
 # MACHINE LEARNING
 # -------------------------------
 st.header("📌 Machine Learning clásico")
-start_ml = time.time()
 
-ml_model = LogisticRegression(max_iter=300)
-ml_model.fit(X_train, y_train)
 
-ml_time = time.time() - start_ml
+@st.cache_resource
+def entrenar_ml(X_train, y_train):
+    """Entrena el modelo clásico y devuelve (modelo, tiempo de entrenamiento)."""
+    start_ml = time.perf_counter()
+
+    ml_model = LogisticRegression(max_iter=300)
+    ml_model.fit(X_train, y_train)
+
+    return ml_model, time.perf_counter() - start_ml
+
+
+ml_model, ml_time = entrenar_ml(X_train, y_train)
 y_pred_ml = ml_model.predict(X_test)
 acc_ml = accuracy_score(y_test, y_pred_ml)
 
@@ -77,17 +91,24 @@ acc_ml = accuracy_score(y_test, y_pred_ml)
 # -------------------------------
 st.header("🧠 Deep Learning (Red Neuronal)")
 
-start_dl = time.time()
 
-dl_model = MLPClassifier(
-    hidden_layer_sizes=hidden_layers,
-    max_iter=max_iter,
-    random_state=42
-)
+@st.cache_resource
+def entrenar_dl(X_train, y_train, hidden_layers, max_iter):
+    """Entrena la red neuronal una vez por combinación de parámetros."""
+    start_dl = time.perf_counter()
+
+    dl_model = MLPClassifier(
+        hidden_layer_sizes=hidden_layers,
+        max_iter=max_iter,
+        random_state=42
+    )
+
+    dl_model.fit(X_train, y_train)
+
+    return dl_model, time.perf_counter() - start_dl
 
-dl_model.fit(X_train, y_train)
 
-dl_time = time.time() - start_dl
+dl_model, dl_time = entrenar_dl(X_train, y_train, hidden_layers, max_iter)
 y_pred_dl = dl_model.predict(X_test)
 acc_dl = accuracy_score(y_test, y_pred_dl)
 
@@ -129,6 +150,7 @@ ax[1].set_xlabel("Predicción")
 ax[1].set_ylabel("Real")
 
 st.pyplot(fig)
+plt.close(fig)
 
 # -------------------------------
 # CONCLUSIONES